@@ -198,6 +198,10 @@ pub fn deep_merge_path(
 
 pub struct Parser<'a> {
     lines: Vec<&'a str>,
+    /// Leading-whitespace width of each line, computed once up front
+    indents: Vec<usize>,
+    /// Whitespace-trimmed view of each line, computed once up front
+    trimmed: Vec<&'a str>,
     pos: usize,
     indent_size: usize,
     explicit_indent: Option<usize>,
@@ -213,8 +217,22 @@ impl<'a> Parser<'a> {
         explicit_indent: Option<usize>,
     ) -> Self {
         let lines: Vec<&str> = input.lines().collect();
+
+        // Scan every line once for its indentation width and trimmed content;
+        // the parser main loop and its lookaheads dispatch on these cached
+        // values instead of re-trimming the same lines repeatedly.
+        let mut indents = Vec::with_capacity(lines.len());
+        let mut trimmed = Vec::with_capacity(lines.len());
+        for line in &lines {
+            let start_trimmed = line.trim_start();
+            indents.push(line.len() - start_trimmed.len());
+            trimmed.push(start_trimmed.trim_end());
+        }
+
         Parser {
             lines,
+            indents,
+            trimmed,
             pos: 0,
             indent_size: 0,
             explicit_indent,
@@ -247,8 +265,8 @@ impl<'a> Parser<'a> {
 
     fn detect_indent_size(&mut self) {
         // Auto-detect indent size by finding first indented line
-        for line in &self.lines {
-            if !line.trim().is_empty() && line.starts_with(' ') {
+        for (i, line) in self.lines.iter().enumerate() {
+            if !self.trimmed[i].is_empty() && line.starts_with(' ') {
                 let spaces = line.chars().take_while(|&c| c == ' ').count();
                 if spaces > 0 {
                     self.indent_size = spaces;
@@ -260,18 +278,18 @@ impl<'a> Parser<'a> {
         self.indent_size = 2;
     }
 
-    fn validate_indentation(&self, py: Python, line: &str) -> PyResult<()> {
+    fn validate_indentation(&self, py: Python, line_idx: usize) -> PyResult<()> {
         if !self.strict {
             return Ok(());
         }
 
         // Skip validation for lines that are only whitespace (empty lines)
-        if line.trim().is_empty() {
+        if self.trimmed[line_idx].is_empty() {
             return Ok(());
         }
 
-        let indent_len = line.len() - line.trim_start().len();
-        let indent_part = &line[..indent_len];
+        let indent_len = self.indents[line_idx];
+        let indent_part = &self.lines[line_idx][..indent_len];
 
         if indent_part.contains('\t') {
             return Err(self.err_here(py, "Tabs are not allowed in indentation"));
@@ -304,7 +322,7 @@ impl<'a> Parser<'a> {
         // Root form detection per TOON Spec v3.0 Section 5
 
         // Skip empty lines at start
-        while self.pos < self.lines.len() && self.lines[self.pos].trim().is_empty() {
+        while self.pos < self.lines.len() && self.trimmed[self.pos].is_empty() {
             self.pos += 1;
         }
 
@@ -314,8 +332,8 @@ impl<'a> Parser<'a> {
         }
 
         let first_line = self.lines[self.pos];
-        self.validate_indentation(py, first_line)?;
-        let first_line_trimmed = first_line.trim();
+        self.validate_indentation(py, self.pos)?;
+        let first_line_trimmed = self.trimmed[self.pos];
 
         // Check if it's a root array header - can be [N]: or [N]{fields}:
         if first_line_trimmed.starts_with('[') && first_line_trimmed.contains(':') {
@@ -366,19 +384,19 @@ impl<'a> Parser<'a> {
         let dict = PyDict::new(py);
 
         while self.pos < self.lines.len() {
-            let line = self.lines[self.pos];
-            self.validate_indentation(py, line)?;
+            let line_idx = self.pos;
+            self.validate_indentation(py, line_idx)?;
 
-            let line_trimmed = line.trim();
+            let line_trimmed = self.trimmed[line_idx];
             if line_trimmed.is_empty() {
                 // Blank line - check if there are more fields at this depth
                 let mut lookahead = self.pos + 1;
-                while lookahead < self.lines.len() && self.lines[lookahead].trim().is_empty() {
+                while lookahead < self.lines.len() && self.trimmed[lookahead].is_empty() {
                     lookahead += 1;
                 }
 
                 if lookahead < self.lines.len() {
-                    let next_depth = self.get_depth(self.lines[lookahead]);
+                    let next_depth = self.depth_at(lookahead);
                     if next_depth >= depth {
                         // More fields at this depth, skip blank line and continue
                         self.pos += 1;
@@ -390,7 +408,7 @@ impl<'a> Parser<'a> {
                 break;
             }
 
-            let line_depth = self.get_depth(line);
+            let line_depth = self.depth_at(line_idx);
 
             if line_depth < depth {
                 // End of this object
@@ -475,14 +493,13 @@ impl<'a> Parser<'a> {
                 if value_part.is_empty() {
                     // Nested object or empty
                     let value = if self.pos < self.lines.len() {
-                        let next_line = self.lines[self.pos];
-                        let next_depth = self.get_depth(next_line);
+                        let next_depth = self.depth_at(self.pos);
 
                         // In non-strict mode, use actual indentation comparison
                         let is_nested = if !self.strict && self.explicit_indent.is_none() {
-                            let current_indent = self.get_indent_spaces(line);
-                            let next_indent = self.get_indent_spaces(next_line);
-                            let next_trimmed = next_line.trim();
+                            let current_indent = self.indents[line_idx];
+                            let next_indent = self.indents[self.pos];
+                            let next_trimmed = self.trimmed[self.pos];
                             next_indent > current_indent
                                 && !next_trimmed.is_empty()
                                 && !next_trimmed.starts_with('-')
@@ -659,12 +676,11 @@ impl<'a> Parser<'a> {
         let list = PyList::empty(py);
 
         while self.pos < self.lines.len() {
-            let line = self.lines[self.pos];
-            let line_trimmed = line.trim();
+            let line_trimmed = self.trimmed[self.pos];
 
             if !line_trimmed.is_empty() {
-                self.validate_indentation(py, line)?;
-                let line_depth = self.get_depth(line);
+                self.validate_indentation(py, self.pos)?;
+                let line_depth = self.depth_at(self.pos);
 
                 if line_depth < expected_depth {
                     break;
@@ -676,12 +692,12 @@ impl<'a> Parser<'a> {
                 }
             } else {
                 let mut lookahead = self.pos + 1;
-                while lookahead < self.lines.len() && self.lines[lookahead].trim().is_empty() {
+                while lookahead < self.lines.len() && self.trimmed[lookahead].is_empty() {
                     lookahead += 1;
                 }
 
                 if lookahead < self.lines.len() {
-                    let next_depth = self.get_depth(self.lines[lookahead]);
+                    let next_depth = self.depth_at(lookahead);
                     if next_depth < expected_depth {
                         break;
                     }
@@ -760,7 +776,13 @@ impl<'a> Parser<'a> {
             return Ok(list.into());
         }
 
-        let values = self.split_by_delimiter(values_str, delimiter);
+        // Fast path for the common quote-free inline array ([N]: 1,2,3):
+        // a plain delimiter split needs no per-character quote tracking.
+        let values: Vec<&str> = if !values_str.contains('"') {
+            values_str.split(delimiter).map(str::trim).collect()
+        } else {
+            self.split_by_delimiter(values_str, delimiter)
+        };
 
         if length > 0 && values.len() != length {
             return Err(self.err_at(
@@ -792,12 +814,11 @@ impl<'a> Parser<'a> {
         let list = PyList::empty(py);
 
         while self.pos < self.lines.len() {
-            let line = self.lines[self.pos];
-            let line_trimmed = line.trim();
+            let line_trimmed = self.trimmed[self.pos];
 
             if !line_trimmed.is_empty() {
-                self.validate_indentation(py, line)?;
-                let line_depth = self.get_depth(line);
+                self.validate_indentation(py, self.pos)?;
+                let line_depth = self.depth_at(self.pos);
 
                 if line_depth < expected_depth {
                     break;
@@ -809,12 +830,12 @@ impl<'a> Parser<'a> {
                 }
             } else {
                 let mut lookahead = self.pos + 1;
-                while lookahead < self.lines.len() && self.lines[lookahead].trim().is_empty() {
+                while lookahead < self.lines.len() && self.trimmed[lookahead].is_empty() {
                     lookahead += 1;
                 }
 
                 if lookahead < self.lines.len() {
-                    let next_depth = self.get_depth(self.lines[lookahead]);
+                    let next_depth = self.depth_at(lookahead);
                     if next_depth < expected_depth {
                         break;
                     }
@@ -900,8 +921,7 @@ impl<'a> Parser<'a> {
 
     fn parse_list_item_object(&mut self, py: Python, list_depth: usize) -> PyResult<Py<PyAny>> {
         let dict = PyDict::new(py);
-        let line = self.lines[self.pos];
-        let line_trimmed = line.trim();
+        let line_trimmed = self.trimmed[self.pos];
 
         if let Some(item_content) = line_trimmed.strip_prefix("- ") {
             if let Some(colon_pos) = item_content.find(':') {
@@ -933,7 +953,7 @@ impl<'a> Parser<'a> {
 
                     if value_part.is_empty() {
                         if self.pos < self.lines.len() {
-                            let next_depth = self.get_depth(self.lines[self.pos]);
+                            let next_depth = self.depth_at(self.pos);
                             if next_depth > list_depth + 1 {
                                 let value = self.parse_object(py, list_depth + 2)?;
                                 dict.set_item(key, value)?;
@@ -948,9 +968,8 @@ impl<'a> Parser<'a> {
         }
 
         while self.pos < self.lines.len() {
-            let line = self.lines[self.pos];
-            self.validate_indentation(py, line)?;
-            let line_depth = self.get_depth(line);
+            self.validate_indentation(py, self.pos)?;
+            let line_depth = self.depth_at(self.pos);
 
             if line_depth <= list_depth {
                 break;
@@ -961,7 +980,7 @@ impl<'a> Parser<'a> {
                 continue;
             }
 
-            let line_trimmed = line.trim();
+            let line_trimmed = self.trimmed[self.pos];
             if let Some(colon_pos) = line_trimmed.find(':') {
                 let key_part = &line_trimmed[..colon_pos];
                 let value_part = line_trimmed[colon_pos + 1..].trim();
@@ -1022,6 +1041,15 @@ impl<'a> Parser<'a> {
             "true" => Ok(PyBool::new(py, true).to_owned().into()),
             "false" => Ok(PyBool::new(py, false).to_owned().into()),
             _ => {
+                // Cheap classifier: only values whose first character can
+                // start a number accepted by the parsers below (digits, sign,
+                // dot, or the inf/nan spellings) are worth a parse attempt;
+                // everything else is a string without running either parser.
+                let first = trimmed.chars().next().unwrap_or(' ');
+                if !matches!(first, '0'..='9' | '-' | '+' | '.' | 'i' | 'I' | 'n' | 'N') {
+                    return Ok(PyString::new(py, trimmed).into());
+                }
+
                 let check_s = if trimmed.starts_with('-') {
                     &trimmed[1..]
                 } else {
@@ -1153,24 +1181,19 @@ impl<'a> Parser<'a> {
         Ok(result)
     }
 
-    fn get_depth(&self, line: &str) -> usize {
-        let leading_spaces = line.len() - line.trim_start().len();
+    fn depth_at(&self, line_idx: usize) -> usize {
         let indent_to_use = if let Some(explicit) = self.explicit_indent {
             explicit
         } else {
             self.indent_size
         };
         if indent_to_use > 0 {
-            leading_spaces / indent_to_use
+            self.indents[line_idx] / indent_to_use
         } else {
             0
         }
     }
 
-    fn get_indent_spaces(&self, line: &str) -> usize {
-        line.len() - line.trim_start().len()
-    }
-
     fn is_tabular_row(&self, line: &str, delimiter: char) -> bool {
         let mut in_quotes = false;
         let mut escape_next = false;
@@ -96,6 +96,8 @@ mod toons {
     ///
     /// Args:
     ///     fp: A file-like object with a read() method returning a string
+    ///         or UTF-8 encoded bytes (e.g. a file opened in binary mode
+    ///         or an io.BytesIO buffer)
     ///     strict: If True (default), enforce strict TOON v3.0 compliance.
     ///             If False, allow some leniency (e.g. blank lines in arrays).
     ///
@@ -119,8 +121,25 @@ mod toons {
         indent: Option<usize>,
     ) -> PyResult<Py<PyAny>> {
         let expand_mode = expand_paths.unwrap_or("off");
-        let read_method = fp.getattr("read")?;
+        let read_method = fp.getattr(pyo3::intern!(py, "read"))?;
         let content = read_method.call0()?;
+        // Binary streams (BytesIO, files opened in "rb") yield bytes: decode
+        // them in place instead of round-tripping through a Python str.
+        if let Ok(bytes) = content.cast::<pyo3::types::PyBytes>() {
+            let content_str = std::str::from_utf8(bytes.as_bytes()).map_err(|e| {
+                PyErr::new::<pyo3::exceptions::PyValueError, _>(format!(
+                    "TOON input bytes are not valid UTF-8: {}",
+                    e
+                ))
+            })?;
+            return crate::deserialization::deserialize(
+                py,
+                content_str,
+                strict,
+                expand_mode,
+                indent,
+            );
+        }
         let content_str: String = content.extract()?;
         crate::deserialization::deserialize(py, &content_str, strict, expand_mode, indent)
     }
@@ -128,7 +147,8 @@ mod toons {
     /// Serialize a Python object to a TOON formatted string.
     ///
     /// Convert a Python object (dict, list, or primitive) to its TOON
-    /// representation.
+    /// representation. Dict keys are emitted in insertion order; no
+    /// sorting is ever applied.
     ///
     /// Args:
     ///     obj: A Python object to serialize (dict, list, str, int, float, bool, None)
@@ -224,7 +244,7 @@ mod toons {
             enable_key_folding,
             flatten_depth,
         )?;
-        let write_method = fp.getattr("write")?;
+        let write_method = fp.getattr(pyo3::intern!(py, "write"))?;
         write_method.call1((toon_str,))?;
         Ok(())
     }
@@ -19,6 +19,14 @@ impl SerializationContext {
     }
 }
 
+thread_local! {
+    /// Length of the most recently produced document, used to pre-size the
+    /// next output buffer: bulk workloads serialize many similar documents,
+    /// so the previous length is a good capacity hint that avoids most of
+    /// the grow-and-copy reallocations while the buffer fills.
+    static LAST_OUTPUT_LEN: std::cell::Cell<usize> = const { std::cell::Cell::new(0) };
+}
+
 /// Serialize a Python object to TOON format string.
 ///
 /// # Arguments
@@ -41,9 +49,11 @@ pub fn serialize(
     key_folding: bool,
     flatten_depth: Option<usize>,
 ) -> PyResult<String> {
-    let mut output = String::new();
+    let capacity = LAST_OUTPUT_LEN.with(|c| c.get()).max(64);
+    let mut output = String::with_capacity(capacity);
     let ctx = SerializationContext::new(key_folding, flatten_depth);
     serialize_value(py, obj, &mut output, 0, delimiter, true, indent_size, &ctx)?;
+    LAST_OUTPUT_LEN.with(|c| c.set(output.len()));
     Ok(output)
 }
 
@@ -58,23 +68,66 @@ pub fn serialize_value(
     indent_size: usize,
     ctx: &SerializationContext,
 ) -> PyResult<()> {
+    // Exact-type fast path: one type-pointer compare per branch, instead of
+    // the conversion-protocol extract ladder below. `bool` is checked before
+    // `int` so it cannot be swallowed by the integer branch.
     if obj.is_none() {
         output.push_str("null");
+    } else if let Ok(b) = obj.cast_exact::<pyo3::types::PyBool>() {
+        output.push_str(if b.is_true() { "true" } else { "false" });
+    } else if let Ok(i) = obj.cast_exact::<pyo3::types::PyInt>() {
+        match i.extract::<i64>() {
+            Ok(v) => write_int(v, output),
+            // Out-of-range int: same float fallback as the general ladder,
+            // which ends in "null" for ints beyond f64 range rather than
+            // raising OverflowError.
+            Err(_) => match i.extract::<f64>() {
+                Ok(f) => write_float(f, output),
+                Err(_) => output.push_str("null"),
+            },
+        }
+    } else if let Ok(f) = obj.cast_exact::<pyo3::types::PyFloat>() {
+        write_float(f.extract::<f64>()?, output);
+    } else if let Ok(s) = obj.cast_exact::<pyo3::types::PyString>() {
+        serialize_string(&s.extract::<String>()?, output, delimiter);
+    } else if let Ok(list) = obj.cast_exact::<PyList>() {
+        serialize_array(
+            py,
+            &list,
+            output,
+            depth,
+            delimiter,
+            is_root,
+            indent_size,
+            ctx,
+        )?;
+    } else if let Ok(dict) = obj.cast_exact::<PyDict>() {
+        serialize_object(
+            py,
+            &dict,
+            output,
+            depth,
+            delimiter,
+            is_root,
+            indent_size,
+            ctx,
+        )?;
+    // Temporal types next: cheap type checks, before the conversion ladder
+    // below burns a failed extract per protocol on them.
+    } else if obj.cast::<PyDateTime>().is_ok()
+        || obj.cast::<PyDate>().is_ok()
+        || obj.cast::<PyTime>().is_ok()
+    {
+        let iso_str = call_isoformat(py, obj)?;
+        serialize_string(&iso_str, output, delimiter);
+    // Fallback ladder: subclasses and objects convertible via __index__ /
+    // __float__ / __str__ protocols.
     } else if let Ok(b) = obj.extract::<bool>() {
         output.push_str(if b { "true" } else { "false" });
     } else if let Ok(i) = obj.extract::<i64>() {
-        write!(output, "{}", i).unwrap();
+        write_int(i, output);
     } else if let Ok(f) = obj.extract::<f64>() {
-        // TOON v3.0: normalize -0 to 0, no exponential notation
-        if f == 0.0 {
-            output.push('0');
-        } else if f.is_finite() {
-            // Format without exponential notation
-            write!(output, "{}", f).unwrap();
-        } else {
-            // NaN, Infinity → null (per spec Section 3)
-            output.push_str("null");
-        }
+        write_float(f, output);
     } else if let Ok(s) = obj.extract::<String>() {
         serialize_string(&s, output, delimiter);
     } else if let Ok(list) = obj.cast::<PyList>() {
@@ -99,15 +152,6 @@ pub fn serialize_value(
             indent_size,
             ctx,
         )?;
-    } else if let Ok(dt) = obj.cast::<PyDateTime>() {
-        let iso_str: String = dt.call_method0("isoformat")?.extract()?;
-        serialize_string(&iso_str, output, delimiter);
-    } else if let Ok(date) = obj.cast::<PyDate>() {
-        let iso_str: String = date.call_method0("isoformat")?.extract()?;
-        serialize_string(&iso_str, output, delimiter);
-    } else if let Ok(time) = obj.cast::<PyTime>() {
-        let iso_str: String = time.call_method0("isoformat")?.extract()?;
-        serialize_string(&iso_str, output, delimiter);
     } else {
         // Unknown type → null (per spec Section 3)
         output.push_str("null");
@@ -115,18 +159,60 @@ pub fn serialize_value(
     Ok(())
 }
 
+/// Write an integer; single digits (the bulk of ids, counts and flags in
+/// tabular payloads) are pushed directly without the Display machinery
+fn write_int(i: i64, output: &mut String) {
+    if (0..=9).contains(&i) {
+        output.push((b'0' + i as u8) as char);
+    } else {
+        write!(output, "{}", i).unwrap();
+    }
+}
+
+/// Write a float per TOON v3.0: normalize -0 to 0, no exponential notation,
+/// NaN/Infinity → null (per spec Section 3)
+fn write_float(f: f64, output: &mut String) {
+    if f == 0.0 {
+        output.push('0');
+    } else if f.is_finite() {
+        // Integer-valued floats (prices, whole-number measurements) render
+        // identically through the integer writer, skipping shortest-repr
+        // float formatting; the 2^53 bound keeps the cast exact.
+        if f.fract() == 0.0 && f.abs() < 9_007_199_254_740_992.0 {
+            write_int(f as i64, output);
+        } else {
+            write!(output, "{}", f).unwrap();
+        }
+    } else {
+        output.push_str("null");
+    }
+}
+
+/// Call `isoformat()` on a datetime/date/time value with an interned method
+/// name, so repeated values in bulk payloads do not allocate a fresh
+/// method-name string per call.
+fn call_isoformat(py: Python, obj: &Bound<'_, PyAny>) -> PyResult<String> {
+    obj.call_method0(pyo3::intern!(py, "isoformat"))?.extract()
+}
+
 /// Serialize a string with proper quoting and escaping per TOON v3.0 Section 7
 pub fn serialize_string(s: &str, output: &mut String, delimiter: char) {
     if needs_quoting(s, delimiter) {
         output.push('"');
-        for ch in s.chars() {
-            match ch {
-                '\\' => output.push_str("\\\\"),
-                '"' => output.push_str("\\\""),
-                '\n' => output.push_str("\\n"),
-                '\r' => output.push_str("\\r"),
-                '\t' => output.push_str("\\t"),
-                _ => output.push(ch),
+        // Most quoted strings (dates, strings holding the delimiter or a
+        // colon) contain nothing to escape: copy them in one slice write.
+        if !s.contains(['\\', '"', '\n', '\r', '\t']) {
+            output.push_str(s);
+        } else {
+            for ch in s.chars() {
+                match ch {
+                    '\\' => output.push_str("\\\\"),
+                    '"' => output.push_str("\\\""),
+                    '\n' => output.push_str("\\n"),
+                    '\r' => output.push_str("\\r"),
+                    '\t' => output.push_str("\\t"),
+                    _ => output.push(ch),
+                }
             }
         }
         output.push('"');
@@ -141,8 +227,10 @@ fn needs_quoting(s: &str, delimiter: char) -> bool {
         return true;
     }
 
-    // Check for leading/trailing whitespace
-    if s.starts_with(|c: char| c.is_whitespace()) || s.ends_with(|c: char| c.is_whitespace()) {
+    let first = s.chars().next().unwrap();
+
+    // Leading whitespace or hyphen, or trailing whitespace
+    if first.is_whitespace() || first == '-' || s.ends_with(|c: char| c.is_whitespace()) {
         return true;
     }
 
@@ -151,12 +239,7 @@ fn needs_quoting(s: &str, delimiter: char) -> bool {
         return true;
     }
 
-    // Check if numeric-like
-    if is_numeric_like(s) {
-        return true;
-    }
-
-    // Check for special characters
+    // Single scan for structural characters and the active delimiter
     for ch in s.chars() {
         match ch {
             ':' | '"' | '\\' | '[' | ']' | '{' | '}' | '\n' | '\r' | '\t' => return true,
@@ -165,9 +248,12 @@ fn needs_quoting(s: &str, delimiter: char) -> bool {
         }
     }
 
-    // Check if starts with hyphen
-    if s.starts_with('-') {
-        return true;
+    // Numeric-like strings must be quoted. Only attempt the float parse when
+    // the first character can actually start a number accepted by f64::parse
+    // (digits, sign, dot, or the inf/nan spellings); everything else cannot
+    // be numeric-like, so the parse attempt is skipped entirely.
+    if matches!(first, '0'..='9' | '+' | '.' | 'i' | 'I' | 'n' | 'N') {
+        return is_numeric_like(s);
     }
 
     false
@@ -189,7 +275,8 @@ fn is_numeric_like(s: &str) -> bool {
 
 /// Write array header with delimiter per TOON v3.0 Section 6
 pub fn write_array_header(output: &mut String, len: usize, delimiter: char, inline: bool) {
-    write!(output, "[{}", len).unwrap();
+    output.push('[');
+    write_int(len as i64, output);
     // Only include delimiter in header if it's not comma (default)
     if delimiter != ',' {
         output.push(delimiter);
@@ -203,7 +290,8 @@ pub fn write_array_header(output: &mut String, len: usize, delimiter: char, inli
 
 /// Write tabular array header with delimiter per TOON v3.0 Section 9.3
 pub fn write_tabular_header(output: &mut String, len: usize, delimiter: char, fields: &[String]) {
-    write!(output, "[{}", len).unwrap();
+    output.push('[');
+    write_int(len as i64, output);
     // Only include delimiter in header if it's not comma (default)
     if delimiter != ',' {
         output.push(delimiter);
@@ -229,21 +317,24 @@ pub fn serialize_object(
     indent_size: usize,
     ctx: &SerializationContext,
 ) -> PyResult<()> {
-    let items: Vec<_> = dict.items().iter().collect();
-
-    if items.is_empty() {
+    if dict.is_empty() {
         // Empty object: no output at root, empty line with key elsewhere
         return Ok(());
     }
 
-    // Collect all top-level keys for collision detection
-    let all_keys: HashSet<String> = items
-        .iter()
-        .map(|item| item.extract::<(String, Bound<'_, PyAny>)>().unwrap().0)
-        .collect();
+    // Collect all top-level keys for collision detection; only needed when
+    // key folding can actually fire at this depth.
+    let all_keys: HashSet<String> = if ctx.key_folding && depth == 0 {
+        dict.keys()
+            .iter()
+            .map(|k| k.extract::<String>())
+            .collect::<Result<_, _>>()?
+    } else {
+        HashSet::new()
+    };
 
-    for (i, item) in items.iter().enumerate() {
-        let (key, value) = item.extract::<(String, Bound<'_, PyAny>)>()?;
+    for (i, (key_obj, value)) in dict.iter().enumerate() {
+        let key: String = key_obj.extract()?;
 
         // Add newline and indentation before each field (except first at root)
         if i > 0 || !is_root {
@@ -374,26 +465,55 @@ pub fn serialize_object(
     Ok(())
 }
 
+thread_local! {
+    /// Bounded memo of raw key -> rendered form (None when the key is safe
+    /// to emit unquoted as-is). The same dict keys repeat across list items
+    /// and documents, so the quote-safety scan and escaping run once per
+    /// distinct key instead of once per emission.
+    static KEY_CACHE: std::cell::RefCell<std::collections::HashMap<String, Option<String>>> =
+        std::cell::RefCell::new(std::collections::HashMap::new());
+}
+
+/// Cap on distinct cached keys, to bound memory on adversarial inputs
+const KEY_CACHE_MAX: usize = 8192;
+
 /// Serialize object key per TOON v3.0 Section 7.3
 pub fn serialize_key(key: &str, output: &mut String) {
-    // Key can be unquoted if matches: ^[A-Za-z_][\w.]*$
+    KEY_CACHE.with(|cache| {
+        let mut cache = cache.borrow_mut();
+        if let Some(rendered) = cache.get(key) {
+            output.push_str(rendered.as_deref().unwrap_or(key));
+            return;
+        }
+        let rendered = render_key(key);
+        output.push_str(rendered.as_deref().unwrap_or(key));
+        if cache.len() < KEY_CACHE_MAX {
+            cache.insert(key.to_string(), rendered);
+        }
+    });
+}
+
+/// Render a key to its quoted/escaped form, or None if it can be emitted
+/// unquoted as-is (matches ^[A-Za-z_][\w.]*$)
+fn render_key(key: &str) -> Option<String> {
     if is_valid_unquoted_key(key) {
-        output.push_str(key);
-    } else {
-        // Quote and escape
-        output.push('"');
-        for ch in key.chars() {
-            match ch {
-                '\\' => output.push_str("\\\\"),
-                '"' => output.push_str("\\\""),
-                '\n' => output.push_str("\\n"),
-                '\r' => output.push_str("\\r"),
-                '\t' => output.push_str("\\t"),
-                _ => output.push(ch),
-            }
+        return None;
+    }
+    // Quote and escape
+    let mut rendered = String::with_capacity(key.len() + 2);
+    rendered.push('"');
+    for ch in key.chars() {
+        match ch {
+            '\\' => rendered.push_str("\\\\"),
+            '"' => rendered.push_str("\\\""),
+            '\n' => rendered.push_str("\\n"),
+            '\r' => rendered.push_str("\\r"),
+            '\t' => rendered.push_str("\\t"),
+            _ => rendered.push(ch),
         }
-        output.push('"');
     }
+    rendered.push('"');
+    Some(rendered)
 }
 
 /// Check if key can be unquoted
@@ -526,30 +646,19 @@ fn write_array_inline(
         }
     } else {
         // Check for tabular format
-        if let Some(fields) = detect_tabular(list)? {
+        if let Some(schema) = detect_tabular(list)? {
             // Tabular array
-            write_tabular_header(output, len, delimiter, &fields);
-            for item in list.iter() {
-                output.push('\n');
-                write_indent(output, depth + 1, indent_size);
-                let dict = item.cast::<PyDict>()?;
-                for (i, field) in fields.iter().enumerate() {
-                    if i > 0 {
-                        output.push(delimiter);
-                    }
-                    let value = dict.get_item(field)?.unwrap();
-                    serialize_value(
-                        py,
-                        &value,
-                        output,
-                        depth + 1,
-                        delimiter,
-                        false,
-                        indent_size,
-                        ctx,
-                    )?;
-                }
-            }
+            write_tabular_header(output, len, delimiter, &schema.names);
+            serialize_tabular_rows(
+                py,
+                list,
+                output,
+                depth + 1,
+                delimiter,
+                &schema,
+                indent_size,
+                ctx,
+            )?;
         } else {
             // Expanded array format
             write_array_header(output, len, delimiter, false);
@@ -604,7 +713,7 @@ fn serialize_array_with_key(
         }
     } else {
         // Check for tabular format (Section 9.3)
-        if let Some(fields) = detect_tabular(list)? {
+        if let Some(schema) = detect_tabular(list)? {
             serialize_tabular_with_key(
                 py,
                 key,
@@ -612,7 +721,7 @@ fn serialize_array_with_key(
                 output,
                 depth,
                 delimiter,
-                &fields,
+                &schema,
                 indent_size,
                 ctx,
             )?;
@@ -668,14 +777,14 @@ pub fn serialize_array(
         }
     } else {
         // Check for tabular format (Section 9.3)
-        if let Some(fields) = detect_tabular(list)? {
+        if let Some(schema) = detect_tabular(list)? {
             serialize_tabular(
                 py,
                 list,
                 output,
                 depth,
                 delimiter,
-                &fields,
+                &schema,
                 is_root,
                 indent_size,
                 ctx,
@@ -703,64 +812,171 @@ fn is_primitive(obj: &Bound<'_, PyAny>) -> bool {
     !obj.is_instance_of::<PyDict>() && !obj.is_instance_of::<PyList>()
 }
 
+/// Field schema of a detected tabular array: the first row's Python key
+/// objects for value lookups, their extracted names for header emission, and
+/// whether every row stores its fields in the same order (letting emission
+/// walk `dict.values()` directly instead of hashing a key per cell).
+pub struct TabularSchema<'py> {
+    keys: Vec<Bound<'py, PyAny>>,
+    names: Vec<String>,
+    uniform_order: bool,
+}
+
 /// Detect if list qualifies for tabular format per Section 9.3
-fn detect_tabular(list: &Bound<'_, PyList>) -> PyResult<Option<Vec<String>>> {
+fn detect_tabular<'py>(list: &Bound<'py, PyList>) -> PyResult<Option<TabularSchema<'py>>> {
     if list.is_empty() {
         return Ok(None);
     }
 
-    // All elements must be dicts
-    let mut all_dicts = true;
-    for item in list.iter() {
-        if !item.is_instance_of::<PyDict>() {
-            all_dicts = false;
-            break;
-        }
-    }
-
-    if !all_dicts {
-        return Ok(None);
-    }
-
-    // Get keys from first dict
     let first_item = list.get_item(0)?;
-    let first_dict = first_item.cast::<PyDict>()?;
-    let first_keys: Vec<String> = first_dict
-        .keys()
-        .iter()
-        .map(|k| k.extract::<String>())
-        .collect::<Result<Vec<_>, _>>()?;
+    let first_dict = match first_item.cast::<PyDict>() {
+        Ok(dict) => dict,
+        Err(_) => return Ok(None),
+    };
+    let first_keys: Vec<_> = first_dict.keys().iter().collect();
 
     if first_keys.is_empty() {
         return Ok(None);
     }
 
-    // Check all dicts have same keys and all values are primitives
+    // Single pass: every element must be a dict with the same schema and
+    // primitive-only values.
+    let mut uniform_order = true;
     for item in list.iter() {
-        let dict = item.cast::<PyDict>()?;
+        let dict = match item.cast::<PyDict>() {
+            Ok(dict) => dict,
+            Err(_) => return Ok(None),
+        };
 
-        // Check key count
         if dict.len() != first_keys.len() {
             return Ok(None);
         }
 
-        // Check all keys present and values are primitives
-        for key in &first_keys {
-            if let Ok(value) = dict.get_item(key) {
-                if let Some(v) = value {
-                    if !is_primitive(&v) {
-                        return Ok(None);
-                    }
-                } else {
+        // Fast path: rows built from the same literal keys share interned
+        // key objects, so a pointer compare (with an equality fallback)
+        // verifies the schema without hashing anything.
+        let mut same_order = true;
+        for (i, key) in dict.keys().iter().enumerate() {
+            let first_key = &first_keys[i];
+            if !key.is(first_key) && !key.eq(first_key)? {
+                same_order = false;
+                break;
+            }
+        }
+
+        if same_order {
+            for value in dict.values() {
+                if !is_primitive(&value) {
                     return Ok(None);
                 }
-            } else {
-                return Ok(None);
+            }
+        } else {
+            // Keys differ positionally: fall back to an order-insensitive
+            // membership check against the first row's keys.
+            uniform_order = false;
+            for key in &first_keys {
+                match dict.get_item(key)? {
+                    Some(value) if is_primitive(&value) => {}
+                    _ => return Ok(None),
+                }
             }
         }
     }
 
-    Ok(Some(first_keys))
+    let names = first_keys
+        .iter()
+        .map(|k| k.extract::<String>())
+        .collect::<Result<Vec<_>, _>>()?;
+
+    Ok(Some(TabularSchema {
+        keys: first_keys,
+        names,
+        uniform_order,
+    }))
+}
+
+/// Emit the rows of a detected tabular array, one per line at `row_depth`.
+///
+/// When detection proved uniform field order, each row's values are read
+/// straight from `dict.values()`; otherwise values are fetched with the
+/// first row's key objects.
+fn serialize_tabular_rows(
+    py: Python,
+    list: &Bound<'_, PyList>,
+    output: &mut String,
+    row_depth: usize,
+    delimiter: char,
+    schema: &TabularSchema<'_>,
+    indent_size: usize,
+    ctx: &SerializationContext,
+) -> PyResult<()> {
+    for item in list.iter() {
+        output.push('\n');
+        write_indent(output, row_depth, indent_size);
+
+        let dict = item.cast::<PyDict>()?;
+        if schema.uniform_order {
+            // First cell outside the loop, so the remaining cells need no
+            // leading-delimiter branch per cell
+            let mut values = dict.values().iter();
+            if let Some(value) = values.next() {
+                serialize_value(
+                    py,
+                    &value,
+                    output,
+                    row_depth,
+                    delimiter,
+                    false,
+                    indent_size,
+                    ctx,
+                )?;
+            }
+            for value in values {
+                output.push(delimiter);
+                serialize_value(
+                    py,
+                    &value,
+                    output,
+                    row_depth,
+                    delimiter,
+                    false,
+                    indent_size,
+                    ctx,
+                )?;
+            }
+        } else {
+            let mut keys = schema.keys.iter();
+            if let Some(key) = keys.next() {
+                let value = dict.get_item(key)?.unwrap();
+                serialize_value(
+                    py,
+                    &value,
+                    output,
+                    row_depth,
+                    delimiter,
+                    false,
+                    indent_size,
+                    ctx,
+                )?;
+            }
+            for key in keys {
+                output.push(delimiter);
+                let value = dict.get_item(key)?.unwrap();
+                serialize_value(
+                    py,
+                    &value,
+                    output,
+                    row_depth,
+                    delimiter,
+                    false,
+                    indent_size,
+                    ctx,
+                )?;
+            }
+        }
+    }
+
+    Ok(())
 }
 
 /// Serialize array in tabular format per Section 9.3
@@ -770,7 +986,7 @@ fn serialize_tabular(
     output: &mut String,
     depth: usize,
     delimiter: char,
-    fields: &[String],
+    schema: &TabularSchema<'_>,
     is_root: bool,
     indent_size: usize,
     ctx: &SerializationContext,
@@ -782,33 +998,19 @@ fn serialize_tabular(
         output.push('\n');
         write_indent(output, depth, indent_size);
     }
-    write_tabular_header(output, len, delimiter, fields);
+    write_tabular_header(output, len, delimiter, &schema.names);
 
     // Rows: one per object
-    for item in list.iter() {
-        output.push('\n');
-        write_indent(output, depth + 1, indent_size);
-
-        let dict = item.cast::<PyDict>()?;
-        for (i, field) in fields.iter().enumerate() {
-            if i > 0 {
-                output.push(delimiter);
-            }
-            let value = dict.get_item(field)?.unwrap();
-            serialize_value(
-                py,
-                &value,
-                output,
-                depth + 1,
-                delimiter,
-                false,
-                indent_size,
-                ctx,
-            )?;
-        }
-    }
-
-    Ok(())
+    serialize_tabular_rows(
+        py,
+        list,
+        output,
+        depth + 1,
+        delimiter,
+        schema,
+        indent_size,
+        ctx,
+    )
 }
 
 /// Serialize array in tabular format with key (for object values)
@@ -819,7 +1021,7 @@ fn serialize_tabular_with_key(
     output: &mut String,
     depth: usize,
     delimiter: char,
-    fields: &[String],
+    schema: &TabularSchema<'_>,
     indent_size: usize,
     ctx: &SerializationContext,
 ) -> PyResult<()> {
@@ -827,33 +1029,19 @@ fn serialize_tabular_with_key(
 
     // Header: key[N]{f1,f2,f3}:
     serialize_key(key, output);
-    write_tabular_header(output, len, delimiter, fields);
+    write_tabular_header(output, len, delimiter, &schema.names);
 
     // Rows: one per object
-    for item in list.iter() {
-        output.push('\n');
-        write_indent(output, depth + 1, indent_size);
-
-        let dict = item.cast::<PyDict>()?;
-        for (i, field) in fields.iter().enumerate() {
-            if i > 0 {
-                output.push(delimiter);
-            }
-            let value = dict.get_item(field)?.unwrap();
-            serialize_value(
-                py,
-                &value,
-                output,
-                depth + 1,
-                delimiter,
-                false,
-                indent_size,
-                ctx,
-            )?;
-        }
-    }
-
-    Ok(())
+    serialize_tabular_rows(
+        py,
+        list,
+        output,
+        depth + 1,
+        delimiter,
+        schema,
+        indent_size,
+        ctx,
+    )
 }
 
 /// Serialize array in expanded list format with key (for object values)
@@ -1004,31 +1192,20 @@ fn serialize_expanded_list(
                 }
             } else {
                 // Nested complex array - header should be on same line as hyphen
-                if let Some(fields) = detect_tabular(&inner_list)? {
+                if let Some(schema) = detect_tabular(&inner_list)? {
                     // Tabular format: [N]{f1,f2}:
-                    write_tabular_header(output, inner_list.len(), delimiter, &fields);
+                    write_tabular_header(output, inner_list.len(), delimiter, &schema.names);
                     // Rows at depth + 2
-                    for row_item in inner_list.iter() {
-                        output.push('\n');
-                        write_indent(output, depth + 2, indent_size);
-                        let dict = row_item.cast::<PyDict>()?;
-                        for (i, field) in fields.iter().enumerate() {
-                            if i > 0 {
-                                output.push(delimiter);
-                            }
-                            let value = dict.get_item(field)?.unwrap();
-                            serialize_value(
-                                py,
-                                &value,
-                                output,
-                                depth + 2,
-                                delimiter,
-                                false,
-                                indent_size,
-                                ctx,
-                            )?;
-                        }
-                    }
+                    serialize_tabular_rows(
+                        py,
+                        &inner_list,
+                        output,
+                        depth + 2,
+                        delimiter,
+                        &schema,
+                        indent_size,
+                        ctx,
+                    )?;
                 } else {
                     // Expanded list format: [N]:
                     write_array_header(output, inner_list.len(), delimiter, false);
@@ -1210,9 +1387,16 @@ fn serialize_list_item_object(
     Ok(())
 }
 
+/// Pre-built run of spaces so indentation is copied in slices instead of
+/// pushed one character at a time (covers 32 levels at the default indent).
+const INDENT_SLAB: &str = "                                                                ";
+
 /// Write indentation (2 spaces per level per spec default)
 pub fn write_indent(output: &mut String, depth: usize, indent_size: usize) {
-    for _ in 0..depth * indent_size {
-        output.push(' ');
+    let mut remaining = depth * indent_size;
+    while remaining >= INDENT_SLAB.len() {
+        output.push_str(INDENT_SLAB);
+        remaining -= INDENT_SLAB.len();
     }
+    output.push_str(&INDENT_SLAB[..remaining]);
 }
@@ -3,13 +3,23 @@ import pathlib
 import pytest
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def test_path() -> pathlib.Path:
     """Path to the current test file"""
     return pathlib.Path(__file__).parent
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def data_dir(test_path) -> pathlib.Path:
     """Path to test data directory"""
     return test_path / "data"
+
+
+@pytest.fixture(scope="session")
+def toon_tmp_dir(tmp_path_factory) -> pathlib.Path:
+    """Single session-wide scratch directory for tests that write TOON files.
+
+    Cheaper than function-scoped ``tmp_path``, which creates and tears down
+    a fresh directory for every parametrized case.
+    """
+    return tmp_path_factory.mktemp("toon")
@@ -20,22 +20,33 @@ import pytest
 import toons
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def json_data(data_dir):
-    """Load complex test data from JSON file"""
+    """Load complex test data from JSON file, read once per session"""
     json_path = data_dir / "complex_test.json"
     with open(json_path, "r", encoding="utf-8") as f:
         return json.load(f)
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def expected_toon(data_dir):
-    """Load expected TOON serialization"""
+    """Load expected TOON serialization, read once per session"""
     toon_path = data_dir / "complex_test.toon"
     with open(toon_path, "r", encoding="utf-8") as f:
         return f.read().strip()
 
 
+@pytest.fixture(scope="session")
+def dumped_toon(json_data):
+    """Serialize the complex payload once and share the result.
+
+    Several tests compare against the dumps() output of the same data;
+    encoding it once avoids re-serializing the largest test payload per test.
+    """
+    return toons.dumps(json_data)
+
+
+@pytest.mark.slow
 class TestComplexRegression:
     """Test round-trip conversion for complex data structures"""
 
@@ -44,35 +55,27 @@ class TestComplexRegression:
         toon_data = toons.loads(expected_toon)
         assert toon_data == json_data
 
-    def test_dumps_to_toon_equals_expected(self, json_data, expected_toon):
+    def test_dumps_to_toon_equals_expected(self, dumped_toon, expected_toon):
         """Dumping JSON data produces the expected TOON serialization"""
-        toon_output = toons.dumps(json_data)
-        assert toon_output == expected_toon
+        assert dumped_toon == expected_toon
 
-    def test_full_round_trip_preserves_data(self, json_data):
+    def test_full_round_trip_preserves_data(self, json_data, dumped_toon):
         """Complete round-trip (dict -> TOON -> dict) preserves all data"""
-        # Serialize to TOON
-        toon_str = toons.dumps(json_data)
-
-        # Deserialize back to dict
-        reconstructed = toons.loads(toon_str)
+        # Deserialize the shared serialization back to dict
+        reconstructed = toons.loads(dumped_toon)
 
         # Verify exact match
         assert reconstructed == json_data
 
-    def test_dump_equals_dumps(self, json_data, expected_toon):
+    def test_dump_equals_dumps(self, json_data, dumped_toon, expected_toon):
         """Ensure dump to file matches dumps output"""
-        # Serialize using dumps
-        toon_str = toons.dumps(json_data)
-
         # Serialize using dump to a StringIO buffer
         buffer = io.StringIO()
         toons.dump(json_data, buffer)
-        buffer.seek(0)
-        dumped_str = buffer.read()
+        dumped_str = buffer.getvalue()
 
         # Verify both methods produce the same TOON string
-        assert dumped_str == toon_str == expected_toon
+        assert dumped_str == dumped_toon == expected_toon
 
     def test_load_equals_loads(self, expected_toon):
         """Ensure load from file matches loads output"""
@@ -14,111 +14,122 @@ import pytest
 import toons
 
 
-class TestDateTimeSerialization:
-    """Test serialization of datetime objects to strings."""
-
-    def test_datetime_object_serializes_to_string(self):
-        """datetime.datetime serializes to ISO format string."""
-        data = {"timestamp": datetime(2025, 2, 7, 14, 30, 45)}
-        assert 'timestamp: "2025-02-07T14:30:45"' == toons.dumps(data)
-
-    def test_datetime_in_array(self):
-        """datetime in array serializes to string."""
-        data = {
-            "times": [
-                datetime(2025, 1, 1, 0, 0, 0),
-                datetime(2025, 2, 7, 14, 30, 45),
-            ]
-        }
-        assert (
-            'times[2]: "2025-01-01T00:00:00","2025-02-07T14:30:45"'
-            == toons.dumps(data)
-        )
-
-    def test_datetime_nested_object(self):
-        """datetime in nested objects serializes to string."""
-        data = {
-            "events": [
-                {"name": "Event A", "when": datetime(2025, 2, 7, 10, 0, 0)},
-                {"name": "Event B", "when": datetime(2025, 2, 7, 15, 30, 0)},
-            ]
-        }
-        assert (
-            'events[2]{name,when}:\n  Event A,"2025-02-07T10:00:00"\n  Event B,"2025-02-07T15:30:00"'
-            == toons.dumps(data)
-        )
-
-
-class TestDateSerialization:
-    """Test serialization of date objects to strings."""
-
-    def test_date_object_serializes_to_string(self):
-        """datetime.date serializes to ISO format string."""
-        data = {"day": date(2025, 2, 7)}
-        assert "day: 2025-02-07" == toons.dumps(data)
-
-    def test_date_in_array(self):
-        """date in array serializes to string."""
-        data = {"dates": [date(2025, 1, 1), date(2025, 2, 7)]}
-        assert "dates[2]: 2025-01-01,2025-02-07" == toons.dumps(data)
-
-    def test_date_in_objects(self):
-        """date in object array serializes to string."""
-        data = [
-            {"name": "Birth", "date": date(2000, 1, 15)},
-            {"name": "Event", "date": date(2025, 2, 7)},
-        ]
-        assert (
-            "[2]{name,date}:\n  Birth,2000-01-15\n  Event,2025-02-07"
-            == toons.dumps(data)
-        )
-
-
-class TestTimeSerialization:
-    """Test serialization of time objects to strings."""
-
-    def test_time_object_serializes_to_string(self):
-        """datetime.time serializes to ISO format string."""
-        data = {"clock": time(14, 30, 45)}
-        assert 'clock: "14:30:45"' == toons.dumps(data)
-
-    def test_time_in_array(self):
-        """time in array serializes to string."""
-        data = {"business_hours": [time(9, 0, 0), time(17, 30, 0)]}
-        assert 'business_hours[2]: "09:00:00","17:30:00"' == toons.dumps(data)
-
-    def test_time_in_objects(self):
-        """time in object array serializes to string."""
-        data = [
-            {"activity": "breakfast", "time": time(8, 0, 0)},
-            {"activity": "lunch", "time": time(12, 30, 0)},
-        ]
-        assert (
-            '[2]{activity,time}:\n  breakfast,"08:00:00"\n  lunch,"12:30:00"'
-            == toons.dumps(data)
-        )
-
-
-class TestDecimalSerialization:
-    """Test serialization of Decimal objects to strings."""
-
-    def test_decimal_object_serializes_to_string(self):
-        """Decimal serializes to string representation."""
-        data = {"price": Decimal("19.99")}
-        assert "price: 19.99" == toons.dumps(data)
-
-    @pytest.mark.xfail(
-        reason="Decimal trailing zeros not preserved in serialization"
+class TestNonSerializableDumps:
+    """Table-driven serialization tests for datetime/date/time/Decimal."""
+
+    @pytest.mark.parametrize(
+        "data, expected",
+        [
+            pytest.param(
+                {"timestamp": datetime(2025, 2, 7, 14, 30, 45)},
+                'timestamp: "2025-02-07T14:30:45"',
+                id="datetime",
+            ),
+            pytest.param(
+                {"day": date(2025, 2, 7)},
+                "day: 2025-02-07",
+                id="date",
+            ),
+            pytest.param(
+                {"clock": time(14, 30, 45)},
+                'clock: "14:30:45"',
+                id="time",
+            ),
+            pytest.param(
+                {"price": Decimal("19.99")},
+                "price: 19.99",
+                id="decimal",
+            ),
+            pytest.param(
+                {"value": Decimal("10.123456789")},
+                "value: 10.123456789",
+                id="decimal-precision",
+            ),
+        ],
     )
-    def test_decimal_in_array(self):
-        """Decimal in array serializes to string."""
-        data = {"prices": [Decimal("10.50"), Decimal("25.99")]}
-        assert "prices[2]: 10.50,25.99" == toons.dumps(data)
-
-    def test_decimal_precision_preserved(self):
-        """Decimal precision is preserved in serialization."""
-        data = {"value": Decimal("10.123456789")}
-        assert "value: 10.123456789" == toons.dumps(data)
+    def test_scalar_serializes_to_string(self, data, expected):
+        """Scalar values serialize to their ISO/string representations."""
+        assert expected == toons.dumps(data)
+
+    @pytest.mark.parametrize(
+        "data, expected",
+        [
+            pytest.param(
+                {
+                    "times": [
+                        datetime(2025, 1, 1, 0, 0, 0),
+                        datetime(2025, 2, 7, 14, 30, 45),
+                    ]
+                },
+                'times[2]: "2025-01-01T00:00:00","2025-02-07T14:30:45"',
+                id="datetime",
+            ),
+            pytest.param(
+                {"dates": [date(2025, 1, 1), date(2025, 2, 7)]},
+                "dates[2]: 2025-01-01,2025-02-07",
+                id="date",
+            ),
+            pytest.param(
+                {"business_hours": [time(9, 0, 0), time(17, 30, 0)]},
+                'business_hours[2]: "09:00:00","17:30:00"',
+                id="time",
+            ),
+            pytest.param(
+                {"prices": [Decimal("10.50"), Decimal("25.99")]},
+                "prices[2]: 10.50,25.99",
+                id="decimal",
+                marks=pytest.mark.xfail(
+                    reason="Decimal trailing zeros not preserved in serialization"
+                ),
+            ),
+        ],
+    )
+    def test_in_array(self, data, expected):
+        """Values inside inline arrays serialize to strings."""
+        assert expected == toons.dumps(data)
+
+    @pytest.mark.parametrize(
+        "data, expected",
+        [
+            pytest.param(
+                {
+                    "events": [
+                        {
+                            "name": "Event A",
+                            "when": datetime(2025, 2, 7, 10, 0, 0),
+                        },
+                        {
+                            "name": "Event B",
+                            "when": datetime(2025, 2, 7, 15, 30, 0),
+                        },
+                    ]
+                },
+                'events[2]{name,when}:\n  Event A,"2025-02-07T10:00:00"'
+                '\n  Event B,"2025-02-07T15:30:00"',
+                id="datetime",
+            ),
+            pytest.param(
+                [
+                    {"name": "Birth", "date": date(2000, 1, 15)},
+                    {"name": "Event", "date": date(2025, 2, 7)},
+                ],
+                "[2]{name,date}:\n  Birth,2000-01-15\n  Event,2025-02-07",
+                id="date",
+            ),
+            pytest.param(
+                [
+                    {"activity": "breakfast", "time": time(8, 0, 0)},
+                    {"activity": "lunch", "time": time(12, 30, 0)},
+                ],
+                '[2]{activity,time}:\n  breakfast,"08:00:00"'
+                '\n  lunch,"12:30:00"',
+                id="time",
+            ),
+        ],
+    )
+    def test_in_object_array(self, data, expected):
+        """Values inside tabular object arrays serialize to strings."""
+        assert expected == toons.dumps(data)
 
 
 class TestNonSerializableWithDump:
@@ -1,10 +1,25 @@
 import io
-import tempfile
+import re
 
 import pytest
 
 import toons
 
+# Array with a blank line between entries: rejected in strict mode,
+# tolerated otherwise. Shared by the strict-flag tests below.
+_TOON_BLANK_LINES = "[3]:\n  - 1\n\n  - 2\n  - 3"
+
+# Compiled once; pytest.raises(match=...) accepts a pattern object.
+_BLANK_LINE_RE = re.compile(r"Blank line inside array")
+
+
+@pytest.fixture(scope="session")
+def toon_file(toon_tmp_dir):
+    """Read-only TOON file on disk, written once for the whole session."""
+    path = toon_tmp_dir / "smoke.toon"
+    path.write_text("key: value")
+    return path
+
 
 class TestSmokeLoads:
     """Minimal smoke test for loads() function."""
@@ -41,8 +56,7 @@ class TestSmokeDumps:
         """dumps() serializes basic object."""
         data = {"name": "Alice", "age": 30}
         result = toons.dumps(data)
-        assert "name: Alice" in result
-        assert "age: 30" in result
+        assert result == "name: Alice\nage: 30"
 
     def test_dumps_array(self):
         """dumps() serializes array."""
@@ -54,17 +68,18 @@ class TestSmokeDumps:
         """dumps() serializes uniform object arrays."""
         data = [{"name": "Alice", "age": 30}, {"name": "Bob", "age": 25}]
         result = toons.dumps(data)
-        assert "[2]{" in result
-        assert "Alice" in result
-        assert "Bob" in result
+        assert result == "[2]{name,age}:\n  Alice,30\n  Bob,25"
 
     def test_dumps_with_indent(self):
         """dumps() respects indent parameter."""
         data = {"parent": {"child": "value"}}
         result = toons.dumps(data, indent=4)
-        lines = result.split("\n")
-        assert lines[0] == "parent:"
-        assert lines[1] == "    child: value"
+        assert result == "parent:\n    child: value"
+
+    def test_dumps_int_beyond_f64_is_null(self):
+        """Ints too large for i64 fall back to float, then to null."""
+        assert toons.dumps({"big": 2**70}) == "big: 1180591620717411300000"
+        assert toons.dumps({"huge": 10**400}) == "huge: null"
 
     def test_dumps_with_delimiter(self):
         """dumps() respects delimiter parameter."""
@@ -103,45 +118,72 @@ class TestSmokeDump:
 class TestSmokeLoad:
     """Minimal smoke test for load() function."""
 
-    def test_load_from_file(self):
+    def test_load_from_file(self, toon_file):
         """load() reads from file."""
-        with tempfile.NamedTemporaryFile(mode="w+", suffix=".toon") as f:
-            f.write("key: value")
-            f.seek(0)
+        with open(toon_file) as f:
             result = toons.load(f)
-            assert result == {"key": "value"}
+        assert result == {"key": "value"}
 
     def test_load_array(self):
-        """load() deserializes array from file."""
-        with tempfile.NamedTemporaryFile(mode="w+", suffix=".toon") as f:
-            f.write("[3]: 1,2,3")
-            f.seek(0)
-            result = toons.load(f)
-            assert result == [1, 2, 3]
+        """load() deserializes array from a file-like object."""
+        result = toons.load(io.StringIO("[3]: 1,2,3"))
+        assert result == [1, 2, 3]
+
+    def test_load_bytesio(self):
+        """load() accepts binary streams yielding UTF-8 bytes."""
+        result = toons.load(io.BytesIO(b"[3]: 1,2,3"))
+        assert result == toons.loads("[3]: 1,2,3")
+
+    def test_load_invalid_utf8_bytes(self):
+        """load() rejects binary streams that are not valid UTF-8."""
+        with pytest.raises(ValueError, match="not valid UTF-8"):
+            toons.load(io.BytesIO(b"key: \xff"))
 
 
 class TestSmokeStrictFlag:
     """Minimal smoke test for strict parameter."""
 
-    def test_strict_mode_default(self):
-        """Strict mode is default in loads()."""
-        toon_bad = "[3]:\n  - 1\n\n  - 2\n  - 3"
-        with pytest.raises(ValueError, match="Blank line inside array"):
-            toons.loads(toon_bad)
+    @pytest.mark.parametrize(
+        "kwargs, should_raise",
+        [
+            pytest.param({}, True, id="default"),
+            pytest.param({"strict": True}, True, id="strict"),
+            pytest.param({"strict": False}, False, id="lenient"),
+        ],
+    )
+    def test_loads_strict_flag(self, kwargs, should_raise):
+        """Strict mode is the default; non-strict allows blank lines."""
+        if should_raise:
+            with pytest.raises(ValueError, match=_BLANK_LINE_RE):
+                toons.loads(_TOON_BLANK_LINES, **kwargs)
+        else:
+            result = toons.loads(_TOON_BLANK_LINES, **kwargs)
+            assert result == [1, 2, 3]
 
-    def test_non_strict_mode(self):
-        """Non-strict mode allows blank lines."""
-        toon_bad = "[3]:\n  - 1\n\n  - 2\n  - 3"
-        result = toons.loads(toon_bad, strict=False)
-        assert result == [1, 2, 3]
+    @pytest.mark.slow
+    def test_non_strict_scales_to_large_input(self):
+        """Non-strict blank-line recovery stays linear on large arrays.
+
+        Parses a 10k-element expanded array with a blank line after every
+        third entry; a per-line quadratic recovery path would make this
+        test visibly slow long before it times out.
+        """
+        parts = []
+        for i in range(10_000):
+            parts.append(f"  - {i}")
+            if i % 3 == 0:
+                parts.append("")
+        document = "[10000]:\n" + "\n".join(parts)
+
+        result = toons.loads(document, strict=False)
+
+        assert result == list(range(10_000))
 
     def test_strict_mode_load(self):
         """Strict mode applies to load()."""
-        with tempfile.NamedTemporaryFile(mode="w+", suffix=".toon") as f:
-            f.write("[3]:\n  - 1\n\n  - 2\n  - 3")
-            f.seek(0)
-            with pytest.raises(ValueError, match="Blank line inside array"):
-                toons.load(f)
+        fp = io.StringIO(_TOON_BLANK_LINES)
+        with pytest.raises(ValueError, match=_BLANK_LINE_RE):
+            toons.load(fp)
 
 
 class TestSmokeUnicode:
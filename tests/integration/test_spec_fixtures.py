@@ -8,10 +8,13 @@ It covers all specification requirements for both encoding and decoding.
 Original repository: https://github.com/toon-format/spec/tree/main/tests
 """
 
-import json
+import functools
+import io
+import re
 from pathlib import Path
 from typing import Any
 
+import orjson
 import pytest
 
 import toons
@@ -22,22 +25,19 @@ ENCODE_FIXTURES_DIR = FIXTURES_DIR / "encode"
 DECODE_FIXTURES_DIR = FIXTURES_DIR / "decode"
 
 
+@functools.lru_cache(maxsize=None)
 def load_fixture_file(fixture_path: Path) -> dict[str, Any]:
-    """Load a JSON fixture file."""
-    with open(fixture_path, "r") as f:
-        return json.load(f)
+    """Load a JSON fixture file, reading each file at most once per session."""
+    return orjson.loads(fixture_path.read_bytes())
+
+
+# Matches each non-leading uppercase letter, where an underscore is inserted
+_CAMEL_RE = re.compile(r"(?<!^)(?=[A-Z])")
 
 
 def camel_to_snake(name: str) -> str:
     """Convert camelCase to snake_case."""
-    result = []
-    for i, char in enumerate(name):
-        if char.isupper() and i > 0:
-            result.append("_")
-            result.append(char.lower())
-        else:
-            result.append(char.lower())
-    return "".join(result)
+    return _CAMEL_RE.sub("_", name).lower()
 
 
 def convert_options_to_snake_case(options: dict[str, Any]) -> dict[str, Any]:
@@ -45,11 +45,16 @@ def convert_options_to_snake_case(options: dict[str, Any]) -> dict[str, Any]:
     return {camel_to_snake(key): value for key, value in options.items()}
 
 
-def collect_encode_fixtures() -> list[tuple]:
-    """Collect all encode test cases from fixture files."""
+@functools.lru_cache(maxsize=None)
+def collect_fixtures(fixture_dir: Path) -> tuple[tuple, ...]:
+    """Collect all test cases from the fixture files in a directory.
+
+    Memoized so each directory is globbed and parsed exactly once per
+    session, even though several parametrize sites request it.
+    """
     test_cases = []
 
-    for fixture_file in sorted(ENCODE_FIXTURES_DIR.glob("*.json")):
+    for fixture_file in sorted(fixture_dir.glob("*.json")):
         fixture = load_fixture_file(fixture_file)
         fixture_name = fixture_file.stem
 
@@ -66,36 +71,17 @@ def collect_encode_fixtures() -> list[tuple]:
                 )
             )
 
-    return test_cases
-
-
-def collect_decode_fixtures() -> list[tuple]:
-    """Collect all decode test cases from fixture files."""
-    test_cases = []
-
-    for fixture_file in sorted(DECODE_FIXTURES_DIR.glob("*.json")):
-        fixture = load_fixture_file(fixture_file)
-        fixture_name = fixture_file.stem
+    return tuple(test_cases)
 
-        for test in fixture["tests"]:
-            test_id = f"{fixture_name}::{test['name']}"
-            test_cases.append(
-                (
-                    test_id,
-                    test["input"],
-                    test["expected"],
-                    convert_options_to_snake_case(test.get("options", {})),
-                    test.get("shouldError", False),
-                    test.get("note", ""),
-                )
-            )
 
-    return test_cases
+# Collected once at import; every parametrize site below shares these tuples.
+ENCODE_CASES = collect_fixtures(ENCODE_FIXTURES_DIR)
+DECODE_CASES = collect_fixtures(DECODE_FIXTURES_DIR)
 
 
 @pytest.mark.parametrize(
     "test_id,input_data,expected,options,should_error,note",
-    collect_encode_fixtures(),
+    ENCODE_CASES,
     ids=lambda x: x if isinstance(x, str) else "",
 )
 def test_integration_dumps(
@@ -118,9 +104,10 @@ def test_integration_dumps(
         assert result == expected, f"Failed: {test_id}\nNote: {note}"
 
 
+@pytest.mark.slow
 @pytest.mark.parametrize(
     "test_id,input_data,expected,options,should_error,note",
-    collect_encode_fixtures(),
+    ENCODE_CASES,
     ids=lambda x: x if isinstance(x, str) else "",
 )
 def test_integration_dump(
@@ -130,25 +117,22 @@ def test_integration_dump(
     options: dict[str, Any],
     should_error: bool,
     note: str,
-    tmp_path: Path,
 ):
     """Test encoding from JSON to TOON format."""
-    with open(tmp_path / "temp.toon", "w+t") as f:
-        if should_error:
-            # Test expects an error to be raised
-            with pytest.raises(Exception):
-                toons.dump(input_data, f, **options)
-        else:
-            # Test expects successful encoding
+    f = io.StringIO()
+    if should_error:
+        # Test expects an error to be raised
+        with pytest.raises(Exception):
             toons.dump(input_data, f, **options)
-            f.seek(0)
-            result = f.read()
-            assert result == expected, f"Failed: {test_id}\nNote: {note}"
+    else:
+        # Test expects successful encoding
+        toons.dump(input_data, f, **options)
+        assert f.getvalue() == expected, f"Failed: {test_id}\nNote: {note}"
 
 
 @pytest.mark.parametrize(
     "test_id,input_toon,expected,options,should_error,note",
-    collect_decode_fixtures(),
+    DECODE_CASES,
     ids=lambda x: x if isinstance(x, str) else "",
 )
 def test_integration_loads(
@@ -171,9 +155,10 @@ def test_integration_loads(
         assert result == expected, f"Failed: {test_id}\nNote: {note}"
 
 
+@pytest.mark.slow
 @pytest.mark.parametrize(
     "test_id,input_toon,expected,options,should_error,note",
-    collect_decode_fixtures(),
+    DECODE_CASES,
     ids=lambda x: x if isinstance(x, str) else "",
 )
 def test_integration_load(
@@ -183,19 +168,26 @@ def test_integration_load(
     options: dict[str, Any],
     should_error: bool,
     note: str,
-    tmp_path: Path,
 ):
     """Test decoding from TOON to JSON format."""
+    f = io.StringIO(input_toon)
+
+    if should_error:
+        # Test expects an error to be raised
+        with pytest.raises(Exception):
+            toons.load(f, **options)
+    else:
+        # Test expects successful decoding
+        result = toons.load(f, **options)
+        assert result == expected, f"Failed: {test_id}\nNote: {note}"
 
-    with open(tmp_path / "temp.toon", "w+t") as f:
-        f.write(input_toon)
-        f.seek(0)
 
-        if should_error:
-            # Test expects an error to be raised
-            with pytest.raises(Exception):
-                toons.load(f, **options)
-        else:
-            # Test expects successful decoding
-            result = toons.load(f, **options)
-            assert result == expected, f"Failed: {test_id}\nNote: {note}"
+def test_dump_load_round_trip_on_disk(toon_tmp_dir: Path):
+    """dump/load work against a real file, not just in-memory buffers."""
+    data = {"name": "Alice", "tags": ["admin", "user"]}
+
+    path = toon_tmp_dir / "round_trip.toon"
+    with open(path, "w+t") as f:
+        toons.dump(data, f)
+        f.seek(0)
+        assert toons.load(f) == data
@@ -1,6 +1,6 @@
 """TOONS Python API for parsing and serializing TOON format."""
 
-from typing import IO, Any, Optional
+from typing import IO, Any, Optional, Union
 
 class ToonDecodeError(ValueError):
     """Exception raised by the TOON decoder when input cannot be parsed.
@@ -29,16 +29,17 @@ class ToonDecodeError(ValueError):
     source: Optional[str]
 
 def load(
-    fp: IO[str],
+    fp: Union[IO[str], IO[bytes]],
     *,
     strict: bool = True,
     expand_paths: Optional[str] = None,
     indent: Optional[int] = None,
 ) -> Any:
-    """Parse TOON from a text file object.
+    """Parse TOON from a text or binary file object.
 
     Args:
-        fp: File-like object with a .read() method.
+        fp: File-like object with a .read() method returning str or
+            UTF-8 encoded bytes.
         strict: Enforce strict TOON v3.0 compliance.
         expand_paths: Path expansion mode: None, "off", "safe", "always".
         indent: Optional indentation hint for parsing.
@@ -106,6 +107,8 @@ def dumps(
 ) -> str:
     """Serialize an object to a TOON string.
 
+    Dict keys are emitted in insertion order; no sorting is ever applied.
+
     Args:
         obj: Python object to serialize.
         indent: Spaces per indentation level.